@@ -7,69 +7,232 @@ H2OS Fleet Status Endpoint
 - GET /screenshot/chromium - Chromium window screenshot
 """
 
+import concurrent.futures
+import gzip
+import http
 import http.server
+import io
 import json
 import subprocess
+import socket
 import socketserver
 import os
 import tempfile
+import threading
+import time
+
+try:
+    from Xlib import X as xlib_X, display as xlib_display
+    HAVE_XLIB = True
+except ImportError:
+    HAVE_XLIB = False
+
+# Pillow lets us serve downsampled WebP thumbnails instead of multi-MB
+# full-resolution PNGs; without it screenshots go out as captured
+try:
+    from PIL import Image
+    HAVE_PIL = True
+except ImportError:
+    HAVE_PIL = False
+
+# orjson serializes straight to bytes and is several times faster than
+# stdlib json - worth it on a Pi Zero, but never required
+try:
+    import orjson
+    def dumps_bytes(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def dumps_bytes(obj):
+        return json.dumps(obj).encode()
 
 PORT = 8081
 
+# Cap concurrent request handling - a Pi Zero can't take unbounded threads
+MAX_CONCURRENT_REQUESTS = 8
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# /status cache: dashboards poll every device, so bursts of polls should
+# collapse into one round of service probes instead of 6 forks each
+STATUS_CACHE_TTL = 2.0
+_status_cache = {'t': 0.0, 'body': None, 'gzip': None, 'refreshing': None}
+_status_lock = threading.Lock()
+
+# Shared pool for fanning out status probes - reusing threads instead of
+# creating them per refresh
+_probe_pool = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+
+# Screenshot cache: each capture forks xdotool/import and copies ~MB of
+# PNG, so dashboards polling at fixed intervals should share one capture
+# per endpoint per TTL window
+SCREENSHOT_CACHE_TTL = 1.0
+SCREENSHOT_CACHE_MAX_ENTRIES = 8
+
+# Thumbnail encoding for dashboard polling; full resolution stays
+# available via ?full=1
+THUMBNAIL_MAX_PX = 1024
+THUMBNAIL_QUALITY = 70
+_screenshot_cache = {}  # key -> (monotonic time, png bytes)
+_screenshot_inflight = {}  # key -> Event set when the capture finishes
+_screenshot_lock = threading.Lock()
+
 # X11 environment for screenshot commands
 X11_ENV = {
     'DISPLAY': ':0',
     'XAUTHORITY': '/home/pizero/.Xauthority'
 }
 
-def check_systemd_service(service_name):
-    """Check if a systemd service is active"""
+# Merged once at import - os.environ can be hundreds of entries and
+# rebuilding the dict per subprocess call is wasted allocation
+SUBPROC_ENV = {**os.environ, **X11_ENV}
+
+def check_systemd_services(service_names):
+    """Check which of the given systemd services are active.
+
+    `systemctl is-active` takes multiple units and prints one state per
+    line, so all services cost a single fork/D-Bus round trip. The exit
+    code is non-zero if any unit is inactive - only stdout matters here.
+    """
     try:
         result = subprocess.run(
-            ['systemctl', 'is-active', service_name],
+            ['systemctl', 'is-active'] + list(service_names),
             capture_output=True,
             text=True,
             timeout=5
         )
-        return result.stdout.strip() == 'active'
+        states = result.stdout.strip().split('\n')
+        active = {name: False for name in service_names}
+        for name, state in zip(service_names, states):
+            active[name] = state.strip() == 'active'
+        return active
     except Exception:
-        return False
+        return {name: False for name in service_names}
+
+def check_processes(patterns):
+    """Check which of the given patterns match a running process.
+
+    Walks /proc/<pid>/cmdline directly - one pass for all patterns and
+    zero forks, versus ~5-20ms of fork+exec for a `ps`/`pgrep` child on
+    a Pi Zero. Falls back to one `ps` sweep if /proc isn't readable.
+    """
+    try:
+        found = {p: False for p in patterns}
+        encoded = [(p, p.encode()) for p in patterns]
+        for pid in os.listdir('/proc'):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                    cmd = f.read().replace(b'\x00', b' ')
+            except OSError:
+                continue
+            for p, needle in encoded:
+                if not found[p] and needle in cmd:
+                    found[p] = True
+        return found
+    except OSError:
+        pass
 
-def check_process(pattern):
-    """Check if a process matching pattern is running"""
     try:
         result = subprocess.run(
-            ['pgrep', '-f', pattern],
+            ['ps', '-eo', 'args='],
             capture_output=True,
+            text=True,
             timeout=5
         )
-        return result.returncode == 0
+        lines = result.stdout.split('\n')
+        return {p: any(p in line for line in lines) for p in patterns}
     except Exception:
-        return False
+        return {p: False for p in patterns}
+
+# /proc/uptime fd is opened once and re-read with pread - no open/close
+# churn per status refresh (freshness comes from the 2s status cache)
+_uptime_fd = None
 
 def get_uptime():
     """Get system uptime"""
+    global _uptime_fd
     try:
-        with open('/proc/uptime', 'r') as f:
-            uptime_seconds = float(f.readline().split()[0])
-            days = int(uptime_seconds // 86400)
-            hours = int((uptime_seconds % 86400) // 3600)
-            if days > 0:
-                return f"{days}d {hours}h"
-            return f"{hours}h"
+        if _uptime_fd is None:
+            _uptime_fd = os.open('/proc/uptime', os.O_RDONLY)
+        raw = os.pread(_uptime_fd, 64, 0)
+        uptime_seconds = float(raw.split()[0])
+        days = int(uptime_seconds // 86400)
+        hours = int((uptime_seconds % 86400) // 3600)
+        if days > 0:
+            return f"{days}d {hours}h"
+        return f"{hours}h"
     except Exception:
         return "unknown"
 
+# Window list cache: fetched once per TTL from _NET_CLIENT_LIST over a
+# persistent X connection instead of forking xdotool per lookup
+WINDOW_CACHE_TTL = 5.0
+_window_cache = {'t': 0.0, 'windows': None}
+_window_lock = threading.Lock()
+_x_display = None
+
+def _get_x_display():
+    """Open (once) and return the persistent Xlib display connection"""
+    global _x_display
+    if _x_display is None:
+        _x_display = xlib_display.Display(X11_ENV['DISPLAY'])
+    return _x_display
+
+def _list_windows():
+    """Return [(window_id, name), ...] for all managed windows.
+
+    Reads _NET_CLIENT_LIST from the root window, cached for
+    WINDOW_CACHE_TTL seconds. Raises on any X error so callers can fall
+    back to xdotool.
+    """
+    with _window_lock:
+        if (_window_cache['windows'] is not None
+                and time.monotonic() - _window_cache['t'] < WINDOW_CACHE_TTL):
+            return _window_cache['windows']
+
+        dpy = _get_x_display()
+        root = dpy.screen().root
+        client_list = root.get_full_property(
+            dpy.intern_atom('_NET_CLIENT_LIST'), 0)
+        windows = []
+        for wid in (client_list.value if client_list else []):
+            win = dpy.create_resource_object('window', wid)
+            name = win.get_full_property(
+                dpy.intern_atom('_NET_WM_NAME'), 0)
+            if name is None:
+                name = win.get_full_property(
+                    dpy.intern_atom('WM_NAME'), 0)
+            if name is None:
+                continue
+            value = name.value
+            if isinstance(value, bytes):
+                value = value.decode('utf-8', 'replace')
+            windows.append((int(wid), value))
+
+        _window_cache['windows'] = windows
+        _window_cache['t'] = time.monotonic()
+        return windows
+
 def get_window_id(pattern):
-    """Get window ID matching pattern using wmctrl or xdotool"""
+    """Get window ID matching pattern via the cached X window list,
+    falling back to xdotool if python-xlib is unavailable"""
+    if HAVE_XLIB:
+        try:
+            for wid, name in _list_windows():
+                if pattern.lower() in name.lower():
+                    return str(wid)
+            return None
+        except Exception:
+            # Dead/absent X connection - reset and use the fork path
+            global _x_display
+            _x_display = None
     try:
-        # Try xdotool first
         result = subprocess.run(
             ['xdotool', 'search', '--name', pattern],
             capture_output=True,
             text=True,
             timeout=5,
-            env={**os.environ, **X11_ENV}
+            env=SUBPROC_ENV
         )
         if result.returncode == 0 and result.stdout.strip():
             # Return first matching window
@@ -78,120 +241,510 @@ def get_window_id(pattern):
         pass
     return None
 
-def take_screenshot(window_id=None):
-    """Take a screenshot, optionally of a specific window"""
+def _lower_priority():
+    """preexec_fn for screenshot subprocesses: nice +10 and SCHED_BATCH
+    so a running capture can't starve the status handler threads on a
+    single-core Pi Zero. Shots take slightly longer under load; /status
+    latency stays flat."""
     try:
-        # Create temp path but delete file first - scrot won't overwrite
-        temp_path = tempfile.mktemp(suffix='.png')
+        os.nice(10)
+    except OSError:
+        pass
+    try:
+        os.sched_setscheduler(0, os.SCHED_BATCH, os.sched_param(0))
+    except (AttributeError, OSError):
+        pass
+
+def _capture_to_memory_file(command, env=None, memfd_prefix=None):
+    """Run a screenshot command that insists on an output path, backed
+    by memory instead of the SD card.
+
+    If `memfd_prefix` is given (e.g. 'png:' for ImageMagick, which
+    overwrites and takes an explicit format prefix), a memfd is passed
+    to the child as /proc/self/fd/N first. scrot can't target a memfd
+    at all - it refuses existing paths and picks its encoder from the
+    filename extension - so scrot-based commands leave memfd_prefix
+    None and use the path branch: a fresh unused .png name under
+    /dev/shm, never pre-created. Either way the PNG stays in RAM.
+    """
+    if memfd_prefix is not None:
+        try:
+            fd = os.memfd_create('screenshot', os.MFD_CLOEXEC)
+        except (AttributeError, OSError):
+            fd = None
+        if fd is not None:
+            try:
+                result = subprocess.run(
+                    command + [f'{memfd_prefix}/proc/self/fd/{fd}'],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=10,
+                    env=env,
+                    pass_fds=(fd,),
+                    preexec_fn=_lower_priority
+                )
+                if result.returncode == 0:
+                    os.lseek(fd, 0, os.SEEK_SET)
+                    chunks = []
+                    while True:
+                        chunk = os.read(fd, 1 << 20)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                    if chunks:
+                        return b''.join(chunks)
+                # Fall through to the path branch on failure
+            finally:
+                os.close(fd)
+
+    # Unused name, file deliberately not pre-created - scrot won't
+    # overwrite an existing file. /dev/shm keeps it RAM-backed.
+    shm_dir = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    temp_path = tempfile.mktemp(suffix='.png', dir=shm_dir)
+    try:
+        result = subprocess.run(
+            command + [temp_path],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=10,
+            env=env,
+            preexec_fn=_lower_priority
+        )
+        if result.returncode != 0 or not os.path.exists(temp_path):
+            return None
+        with open(temp_path, 'rb') as f:
+            return f.read() or None
+    finally:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+def _capture_window_xlib(window_id):
+    """Grab a window's pixels over the persistent X connection and
+    encode PNG in-process.
+
+    Skips the fork/exec and per-invocation X handshake of `import`.
+    Raises on any X/encode problem so the caller can fall back.
+    """
+    dpy = _get_x_display()
+    win = dpy.create_resource_object('window', int(window_id))
+    geo = win.get_geometry()
+    if geo.depth != 24:
+        raise ValueError(f'unsupported window depth {geo.depth}')
+    raw = win.get_image(0, 0, geo.width, geo.height, xlib_X.ZPixmap,
+                        0xffffffff)
+    pixels = raw.data
+    if isinstance(pixels, str):
+        pixels = pixels.encode('latin-1')
+    img = Image.frombytes(
+        'RGB', (geo.width, geo.height), pixels, 'raw', 'BGRX')
+    out = io.BytesIO()
+    # compress_level 1: CPU is scarcer than tunnel bandwidth here, and
+    # thumbnails get re-encoded to WebP anyway
+    img.save(out, 'PNG', compress_level=1)
+    return out.getvalue()
 
+def take_screenshot(window_id=None):
+    """Take a screenshot, optionally of a specific window.
+
+    Window shots prefer an in-process grab over the persistent X
+    connection (python-xlib + Pillow), then import's stdout sink. Full
+    screen goes through the scrot wrapper, which needs a real output
+    path (scrot refuses existing files and picks its encoder from the
+    extension, so it can't write to a pipe) - a RAM-backed one, so
+    nothing touches the SD card either way.
+    """
+    if window_id and HAVE_XLIB and HAVE_PIL:
+        try:
+            return _capture_window_xlib(window_id)
+        except Exception as e:
+            # Dead/absent X connection or odd visual - reset and use
+            # the subprocess path
+            global _x_display
+            _x_display = None
+            print(f"Xlib capture failed, falling back: {e}", flush=True)
+    try:
         if window_id:
-            # Screenshot specific window using import (ImageMagick)
-            env = {**os.environ, **X11_ENV}
+            # Screenshot specific window using import (ImageMagick);
+            # 'png:-' makes it encode to stdout
             result = subprocess.run(
-                ['import', '-window', window_id, temp_path],
-                capture_output=True,
+                ['import', '-window', window_id, 'png:-'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 timeout=10,
-                env=env
-            )
-        else:
-            # Full screen screenshot using wrapper script
-            result = subprocess.run(
-                ['/opt/take-screenshot.sh', temp_path],
-                capture_output=True,
-                timeout=10
+                env=SUBPROC_ENV,
+                preexec_fn=_lower_priority
             )
+            if result.returncode == 0 and result.stdout:
+                return result.stdout
 
-        if result.returncode == 0 and os.path.exists(temp_path):
-            with open(temp_path, 'rb') as f:
-                data = f.read()
-            if data:  # Only return if we got actual data
-                os.unlink(temp_path)
+            # Some import builds refuse to write to a pipe - retry
+            # against a memory-backed file before giving up
+            data = _capture_to_memory_file(
+                ['import', '-window', window_id], env=SUBPROC_ENV,
+                memfd_prefix='png:')
+            if data:
                 return data
 
-        # Debug: log the error
-        print(f"Screenshot failed: rc={result.returncode}, stderr={result.stderr}, stdout={result.stdout}", flush=True)
-        if os.path.exists(temp_path):
-            os.unlink(temp_path)
-        return None
+            # Debug: log the error
+            print(f"Screenshot failed: rc={result.returncode}, stderr={result.stderr}", flush=True)
+            return None
+
+        # Full screen screenshot using the wrapper script, against a
+        # fresh RAM-backed path
+        data = _capture_to_memory_file(['/opt/take-screenshot.sh'])
+        if not data:
+            print("Screenshot failed: wrapper produced no data", flush=True)
+        return data
     except Exception as e:
         print(f"Screenshot exception: {e}", flush=True)
         return None
 
+def encode_thumbnail(data):
+    """Downsample a captured PNG to a <=1024px WebP for dashboard use.
+
+    Returns the original bytes when Pillow is missing or re-encoding
+    fails - never worse than full resolution.
+    """
+    if not data or not HAVE_PIL:
+        return data
+    try:
+        img = Image.open(io.BytesIO(data))
+        img.thumbnail((THUMBNAIL_MAX_PX, THUMBNAIL_MAX_PX))
+        out = io.BytesIO()
+        img.save(out, 'WEBP', quality=THUMBNAIL_QUALITY)
+        return out.getvalue()
+    except Exception as e:
+        print(f"Thumbnail encode failed: {e}", flush=True)
+        return data
+
+def image_content_type(data):
+    """Sniff the served image format (thumbnails are WebP, full-res and
+    fallbacks are PNG)"""
+    if data[:4] == b'RIFF':
+        return 'image/webp'
+    return 'image/png'
+
+def get_cached_screenshot(key, capture):
+    """Return screenshot bytes for `key`, reusing a capture taken less
+    than SCREENSHOT_CACHE_TTL seconds ago.
+
+    Single-flight: concurrent misses on the same key don't race capture
+    tools over the X server - the first caller captures, the rest wait
+    on its Event and reuse the result. Entries are evicted oldest first
+    once the cache exceeds SCREENSHOT_CACHE_MAX_ENTRIES.
+    """
+    with _screenshot_lock:
+        entry = _screenshot_cache.get(key)
+        if entry and time.monotonic() - entry[0] < SCREENSHOT_CACHE_TTL:
+            return entry[1]
+        inflight = _screenshot_inflight.get(key)
+        if inflight is None:
+            inflight = threading.Event()
+            _screenshot_inflight[key] = inflight
+            leader = True
+        else:
+            leader = False
+
+    if not leader:
+        inflight.wait(timeout=12)
+        with _screenshot_lock:
+            entry = _screenshot_cache.get(key)
+        # Even a stale entry beats re-racing the X server here; only a
+        # missing one (leader failed) returns None
+        return entry[1] if entry else None
+
+    try:
+        data = capture()
+        if data:
+            with _screenshot_lock:
+                _screenshot_cache[key] = (time.monotonic(), data)
+                while len(_screenshot_cache) > SCREENSHOT_CACHE_MAX_ENTRIES:
+                    oldest = min(_screenshot_cache, key=lambda k: _screenshot_cache[k][0])
+                    del _screenshot_cache[oldest]
+        return data
+    finally:
+        with _screenshot_lock:
+            _screenshot_inflight.pop(key, None)
+        inflight.set()
+
+def build_status_body():
+    """Probe all services and serialize the status response.
+
+    The systemd, process and uptime probes are independent and mostly
+    wait on the kernel/D-Bus, so they run concurrently: wall time is the
+    slowest probe rather than the sum.
+    """
+    systemd_future = _probe_pool.submit(check_systemd_services, [
+        'groundwater-connection',
+        'groundwater-genie-manager',
+        'groundwater-updater',
+    ])
+    processes_future = _probe_pool.submit(
+        check_processes, ['kmzero.sh', 'groundwater.sh', 'main.py'])
+    uptime_future = _probe_pool.submit(get_uptime)
+
+    systemd_services = systemd_future.result(timeout=6)
+    processes = processes_future.result(timeout=6)
+
+    all_services = {**systemd_services, **processes}
+    running_count = sum(1 for v in all_services.values() if v)
+    total_count = len(all_services)
+
+    if running_count == total_count:
+        overall = 'healthy'
+    elif running_count > 0:
+        overall = 'partial'
+    else:
+        overall = 'offline'
+
+    response = {
+        'status': overall,
+        'systemd': systemd_services,
+        'processes': processes,
+        'running': running_count,
+        'total': total_count,
+        'uptime': uptime_future.result(timeout=6)
+    }
+    return dumps_bytes(response)
+
+def get_status_body(gzipped=False):
+    """Return status JSON bytes, cached for STATUS_CACHE_TTL seconds.
+
+    Single-flight: while one thread refreshes, concurrent callers wait
+    on its Event and reuse the result instead of probing again. The
+    gzip variant is compressed once per refresh and cached alongside
+    the plain bytes.
+    """
+    variant = 'gzip' if gzipped else 'body'
+    with _status_lock:
+        age = time.monotonic() - _status_cache['t']
+        if _status_cache['body'] is not None and age < STATUS_CACHE_TTL:
+            return _status_cache[variant]
+        refresh = _status_cache['refreshing']
+        if refresh is None:
+            refresh = threading.Event()
+            _status_cache['refreshing'] = refresh
+            leader = True
+        else:
+            leader = False
+
+    if not leader:
+        refresh.wait(timeout=30)
+        with _status_lock:
+            if _status_cache['body'] is not None:
+                return _status_cache[variant]
+        # Leader failed to produce a result - fall through and probe ourselves
+        body = build_status_body()
+        return gzip.compress(body, compresslevel=1) if gzipped else body
+
+    try:
+        body = build_status_body()
+        with _status_lock:
+            _status_cache['body'] = body
+            _status_cache['gzip'] = gzip.compress(body, compresslevel=1)
+            _status_cache['t'] = time.monotonic()
+            return _status_cache[variant]
+    finally:
+        with _status_lock:
+            _status_cache['refreshing'] = None
+        refresh.set()
+
 class StatusHandler(http.server.BaseHTTPRequestHandler):
+    # HTTP/1.1 keep-alive: pollers reuse one connection instead of a TCP
+    # handshake per request (send_full_response always sets
+    # Content-Length, which keep-alive requires)
+    protocol_version = 'HTTP/1.1'
+
+    # Idle keep-alive connections must not pin handler threads forever:
+    # handle_one_request treats this socket timeout as close_connection
+    timeout = 30
+
+    def setup(self):
+        super().setup()
+        # Small JSON responses shouldn't sit out a Nagle/delayed-ACK
+        # round trip
+        try:
+            self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
+
     def log_message(self, format, *args):
         pass  # Suppress logging
 
+    def send_full_response(self, code, body, content_type='application/json',
+                           extra_headers=None):
+        """Assemble status line, headers and body into one buffer and
+        write it with a single send() instead of one per header block"""
+        buf = bytearray()
+        phrase = http.HTTPStatus(code).phrase
+        buf += f'{self.protocol_version} {code} {phrase}\r\n'.encode('latin-1')
+        headers = [
+            ('Server', self.version_string()),
+            ('Date', self.date_time_string()),
+            ('Content-Type', content_type),
+            ('Content-Length', str(len(body))),
+            ('Access-Control-Allow-Origin', '*'),
+        ]
+        headers.extend(extra_headers or [])
+        for name, value in headers:
+            buf += f'{name}: {value}\r\n'.encode('latin-1')
+        buf += b'\r\n'
+        buf += body
+        self.wfile.write(bytes(buf))
+
     def do_GET(self):
-        if self.path == '/status' or self.path == '/':
-            self.handle_status()
-        elif self.path == '/screenshot':
-            self.handle_screenshot()
-        elif self.path == '/screenshot/terminal':
-            self.handle_screenshot_terminal()
-        elif self.path == '/screenshot/chromium':
-            self.handle_screenshot_chromium()
-        else:
-            self.send_response(404)
-            self.end_headers()
-
-    def handle_status(self):
-        # Systemd services
-        systemd_services = {
-            'groundwater-connection': check_systemd_service('groundwater-connection'),
-            'groundwater-genie-manager': check_systemd_service('groundwater-genie-manager'),
-            'groundwater-updater': check_systemd_service('groundwater-updater'),
-        }
-
-        # Process checks
-        processes = {
-            'kmzero.sh': check_process('kmzero.sh'),
-            'groundwater.sh': check_process('groundwater.sh'),
-            'main.py': check_process('main.py'),
-        }
-
-        all_services = {**systemd_services, **processes}
-        running_count = sum(1 for v in all_services.values() if v)
-        total_count = len(all_services)
-
-        if running_count == total_count:
-            overall = 'healthy'
-        elif running_count > 0:
-            overall = 'partial'
+        # Shed load instead of queueing when all worker slots are busy
+        if not _request_slots.acquire(blocking=False):
+            self.send_full_response(503, dumps_bytes({'error': 'Server busy'}))
+            return
+        try:
+            self.route_request()
+        finally:
+            _request_slots.release()
+
+    # Exact-path dispatch table; every handler takes full_res so routing
+    # stays a plain dict lookup
+    _ROUTES = {
+        '/': 'handle_status',
+        '/status': 'handle_status',
+        '/screenshot': 'handle_screenshot',
+        '/screenshot/terminal': 'handle_screenshot_terminal',
+        '/screenshot/chromium': 'handle_screenshot_chromium',
+    }
+
+    def route_request(self):
+        path, _, query = self.path.partition('?')
+        handler = self._ROUTES.get(path)
+        if handler is None:
+            self.send_full_response(404, dumps_bytes({'error': 'Not found'}))
+            return
+        # ?full=1 skips thumbnail downsampling on screenshot endpoints
+        full_res = 'full=1' in query.split('&')
+        getattr(self, handler)(full_res)
+
+    def handle_status(self, full_res=False):
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            self.send_full_response(
+                200, get_status_body(gzipped=True),
+                extra_headers=[('Content-Encoding', 'gzip')])
         else:
-            overall = 'offline'
-
-        response = {
-            'status': overall,
-            'systemd': systemd_services,
-            'processes': processes,
-            'running': running_count,
-            'total': total_count,
-            'uptime': get_uptime()
-        }
-
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode())
-
-    def handle_screenshot(self):
+            self.send_full_response(200, get_status_body())
+
+    def send_screenshot(self, data):
+        self.send_full_response(
+            200, data, content_type=image_content_type(data),
+            extra_headers=[('Cache-Control', 'max-age=1')])
+
+    def handle_screenshot(self, full_res=False):
         """Full screen screenshot"""
+        if full_res:
+            # Full-res shots are the multi-MB case - stream them as the
+            # capture tool produces bytes instead of buffering first
+            self.stream_screenshot()
+            return
+        data = get_cached_screenshot(
+            'fullscreen:thumb', lambda: encode_thumbnail(take_screenshot()))
+        if data:
+            self.send_screenshot(data)
+        else:
+            self.send_full_response(
+                500, dumps_bytes({'error': 'Failed to take screenshot'}))
+
+    def stream_screenshot(self):
+        """Stream a full-screen capture with chunked transfer encoding.
+
+        Streams from `import -window root png:-` (the scrot wrapper
+        can't write to a pipe). First bytes go out as soon as the tool
+        produces them, so TTFB is ~ms instead of the full capture
+        duration. If import can't be spawned or produces nothing, falls
+        back to a buffered wrapper capture. Uncached: full-res requests
+        are rare and interactive, not dashboard polling.
+        """
+        try:
+            proc = subprocess.Popen(
+                ['import', '-window', 'root', 'png:-'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=SUBPROC_ENV,
+                preexec_fn=_lower_priority
+            )
+        except OSError as e:
+            # import not installed (setup tolerates the imagemagick
+            # install failing) - buffered path or clean 500, never an
+            # unanswered request
+            print(f"Stream capture spawn failed: {e}", flush=True)
+            self.send_buffered_screenshot()
+            return
+
+        killer = threading.Timer(15, proc.kill)
+        killer.start()
+        try:
+            # Hold the status line until the first chunk arrives so a
+            # failed capture can still be a clean 500 or fall back
+            chunk = proc.stdout.read(32768)
+            if not chunk:
+                proc.wait()
+                self.send_buffered_screenshot()
+                return
+
+            buf = bytearray()
+            buf += f'{self.protocol_version} 200 OK\r\n'.encode('latin-1')
+            for name, value in [
+                ('Server', self.version_string()),
+                ('Date', self.date_time_string()),
+                ('Content-Type', 'image/png'),
+                ('Access-Control-Allow-Origin', '*'),
+                ('Cache-Control', 'no-cache'),
+                ('Transfer-Encoding', 'chunked'),
+            ]:
+                buf += f'{name}: {value}\r\n'.encode('latin-1')
+            buf += b'\r\n'
+            buf += f'{len(chunk):X}\r\n'.encode('latin-1') + chunk + b'\r\n'
+            self.wfile.write(bytes(buf))
+
+            while True:
+                chunk = proc.stdout.read(32768)
+                if not chunk:
+                    break
+                self.wfile.write(
+                    f'{len(chunk):X}\r\n'.encode('latin-1') + chunk + b'\r\n')
+            if proc.wait() != 0:
+                # Partial output must not be framed as a complete 200 -
+                # drop the connection without the terminating chunk so
+                # the client sees a truncated response
+                self.close_connection = True
+                return
+            self.wfile.write(b'0\r\n\r\n')
+        except OSError:
+            # Client went away mid-stream - stop the capture rather
+            # than leaving it running with nobody reading
+            proc.kill()
+            proc.wait()
+            self.close_connection = True
+        finally:
+            killer.cancel()
+
+    def send_buffered_screenshot(self):
+        """Non-streamed full-screen fallback: buffered capture or a
+        clean 500"""
         data = take_screenshot()
         if data:
-            self.send_response(200)
-            self.send_header('Content-Type', 'image/png')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Cache-Control', 'no-cache')
-            self.end_headers()
-            self.wfile.write(data)
+            self.send_screenshot(data)
         else:
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': 'Failed to take screenshot'}).encode())
+            self.send_full_response(
+                500, dumps_bytes({'error': 'Failed to take screenshot'}))
+
+    def capture_window(self, endpoint, window_id, full_res):
+        if full_res:
+            return get_cached_screenshot(
+                f'{endpoint}:{window_id}', lambda: take_screenshot(window_id))
+        return get_cached_screenshot(
+            f'{endpoint}:{window_id}:thumb',
+            lambda: encode_thumbnail(take_screenshot(window_id)))
 
-    def handle_screenshot_terminal(self):
+    def handle_screenshot_terminal(self, full_res=False):
         """Screenshot of terminal window running kmzero.sh"""
         # Find terminal window
         window_id = get_window_id('kmzero')
@@ -201,47 +754,34 @@ class StatusHandler(http.server.BaseHTTPRequestHandler):
             window_id = get_window_id('Terminal')
 
         if window_id:
-            data = take_screenshot(window_id)
+            data = self.capture_window('terminal', window_id, full_res)
             if data:
-                self.send_response(200)
-                self.send_header('Content-Type', 'image/png')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Cache-Control', 'no-cache')
-                self.end_headers()
-                self.wfile.write(data)
+                self.send_screenshot(data)
                 return
 
         # Fallback to full screenshot if can't find terminal
-        self.handle_screenshot()
+        self.handle_screenshot(full_res)
 
-    def handle_screenshot_chromium(self):
+    def handle_screenshot_chromium(self, full_res=False):
         """Screenshot of Chromium browser window"""
         window_id = get_window_id('Chromium')
         if not window_id:
             window_id = get_window_id('Chrome')
 
         if window_id:
-            data = take_screenshot(window_id)
+            data = self.capture_window('chromium', window_id, full_res)
             if data:
-                self.send_response(200)
-                self.send_header('Content-Type', 'image/png')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Cache-Control', 'no-cache')
-                self.end_headers()
-                self.wfile.write(data)
+                self.send_screenshot(data)
                 return
 
         # Return 404 if no Chromium found
-        self.send_response(404)
-        self.send_header('Content-Type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
-        self.wfile.write(json.dumps({'error': 'Chromium not running'}).encode())
+        self.send_full_response(404, dumps_bytes({'error': 'Chromium not running'}))
 
-class ReusableTCPServer(socketserver.TCPServer):
+class ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
     allow_reuse_address = True
+    daemon_threads = True
 
 if __name__ == '__main__':
-    with ReusableTCPServer(('', PORT), StatusHandler) as httpd:
+    with ThreadingHTTPServer(('', PORT), StatusHandler) as httpd:
         print(f"Status server running on port {PORT}")
         httpd.serve_forever()